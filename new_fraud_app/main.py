@@ -1,13 +1,22 @@
 import asyncio
+import dataclasses
 import logging
 from datetime import datetime
 from azure.identity.aio import DefaultAzureCredential
-from semantic_kernel.agents import AzureAIAgent, AzureAIAgentSettings
+from semantic_kernel.agents import AgentGroupChat, AzureAIAgent, AzureAIAgentSettings
 
 from src.domain.entities.transaction import Transaction
 from src.infrastructure.agents.orchestrator_agent import OrchestratorAgent
 from src.infrastructure.agents.verification_agent import VerificationAgent
 from src.infrastructure.agents.report_agent import ReportAgent
+from src.infrastructure.geo.gazetteer import Gazetteer
+from src.infrastructure.geo.impossible_travel import ImpossibleTravelDetector
+from src.infrastructure.merchants.merchant_index import MerchantIndex
+from src.infrastructure.sinks.batching_sink import BatchingResultSink
+from src.infrastructure.sinks.writers import create_writer
+from src.infrastructure.diagnostics.memory_profiler import MemoryProfiler
+from src.application.services.admission_controller import AdmissionController
+from src.application.services.chat_pool import ChatPool
 from src.application.services.fraud_detection_service import FraudDetectionService
 from src.infrastructure.config.settings import settings
 
@@ -32,6 +41,57 @@ async def initialize_agents(client):
     
     return agents
 
+def initialize_location_checker():
+    """Create the impossible-travel check when a gazetteer file is configured."""
+    if not settings.GAZETTEER_PATH:
+        return None
+    return ImpossibleTravelDetector(
+        Gazetteer(settings.GAZETTEER_PATH),
+        max_speed_kmh=settings.MAX_TRAVEL_SPEED_KMH,
+        min_distance_km=settings.MIN_TRAVEL_DISTANCE_KM
+    )
+
+def initialize_merchant_index():
+    """Load the merchant risk index when one is configured."""
+    if not settings.MERCHANT_INDEX_PATH:
+        return None
+    return MerchantIndex(settings.MERCHANT_INDEX_PATH)
+
+def initialize_result_sink():
+    """Create the batched result sink when an output path is configured."""
+    if not settings.RESULT_SINK_PATH:
+        return None
+    return BatchingResultSink(
+        create_writer(settings.RESULT_SINK_FORMAT, settings.RESULT_SINK_PATH),
+        batch_size=settings.RESULT_SINK_BATCH_SIZE,
+        flush_interval=settings.RESULT_SINK_FLUSH_INTERVAL,
+        max_pending=settings.RESULT_SINK_MAX_PENDING
+    )
+
+async def run_soak(fraud_service, template):
+    """Replay a transaction SOAK_TRANSACTIONS times, optionally under tracemalloc."""
+    profiler = MemoryProfiler(report_every=settings.MEMORY_REPORT_EVERY) if settings.MEMORY_PROFILE else None
+    if profiler is not None:
+        profiler.start()
+    
+    try:
+        for i in range(settings.SOAK_TRANSACTIONS):
+            transaction = dataclasses.replace(
+                template,
+                transaction_id=f"{template.transaction_id}-{i}",
+                timestamp=datetime.utcnow()
+            )
+            await fraud_service.process_transaction(transaction)
+            report = profiler.record() if profiler is not None else None
+            if report is not None:
+                logger.info(f"Memory report: {report.to_dict()}")
+    finally:
+        if profiler is not None:
+            logger.info(f"Final memory report: {profiler.report().to_dict()}")
+            profiler.stop()
+    
+    logger.info(f"Soak load stats: {fraud_service.get_load_stats()}")
+
 async def main():
     """Main entry point for the fraud detection system."""
     # Example transaction
@@ -43,6 +103,10 @@ async def main():
         timestamp=datetime.utcnow()  # Add the required timestamp
     )
     
+    result_sink = initialize_result_sink()
+    if result_sink is not None:
+        result_sink.start()
+    
     try:
         async with (
             DefaultAzureCredential() as creds,
@@ -52,16 +116,41 @@ async def main():
             agents = await initialize_agents(client)
             
             # Create fraud detection service
-            fraud_service = FraudDetectionService(agents)
+            fraud_service = FraudDetectionService(
+                agents,
+                location_checker=initialize_location_checker(),
+                merchant_index=initialize_merchant_index(),
+                result_sink=result_sink,
+                admission=AdmissionController(
+                    max_in_flight=settings.MAX_IN_FLIGHT,
+                    latency_threshold=settings.LATENCY_SHED_THRESHOLD_SECONDS
+                ),
+                decision_deadline=settings.DECISION_DEADLINE_SECONDS,
+                max_turns=settings.MAX_AGENT_TURNS,
+                chat_pool=ChatPool(
+                    AgentGroupChat,
+                    max_idle=settings.CHAT_POOL_MAX_IDLE,
+                    max_uses=settings.CHAT_MAX_USES
+                )
+            )
             
             # Process transaction
             fraud_risk = await fraud_service.process_transaction(transaction)
             
             logger.info(f"Fraud risk assessment: {fraud_risk.to_dict()}")
+            logger.info(f"Load stats: {fraud_service.get_load_stats()}")
+            
+            if settings.SOAK_TRANSACTIONS > 0:
+                await run_soak(fraud_service, transaction)
+            
+            await fraud_service.chat_pool.close()
             
     except Exception as e:
         logger.error(f"Error processing transaction: {str(e)}")
         raise
+    finally:
+        if result_sink is not None:
+            await result_sink.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
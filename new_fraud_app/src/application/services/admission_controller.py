@@ -0,0 +1,52 @@
+from typing import Optional
+
+class AdmissionController:
+    """Decides whether a transaction may take the full agent path.
+
+    Requests are shed to the rules-only path when the number in flight
+    reaches ``max_in_flight``. When the smoothed agent-path latency exceeds
+    ``latency_threshold`` seconds, concurrency is cut to ``degraded_in_flight``
+    so the admitted requests keep refreshing the latency estimate and the
+    controller recovers by itself once the backend speeds up again.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 32,
+        latency_threshold: float = 1.5,
+        degraded_in_flight: Optional[int] = None,
+        smoothing: float = 0.2
+    ):
+        self.max_in_flight = max_in_flight
+        self.latency_threshold = latency_threshold
+        self.degraded_in_flight = degraded_in_flight or max(1, max_in_flight // 4)
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self.latency_ewma = 0.0
+
+    @property
+    def overloaded(self) -> bool:
+        return self.latency_ewma > self.latency_threshold
+
+    def try_admit(self) -> bool:
+        """Reserve a slot on the agent path; returns False if the request should be shed."""
+        limit = self.degraded_in_flight if self.overloaded else self.max_in_flight
+        if self.in_flight >= limit:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, latency_seconds: float) -> None:
+        """Free a slot and fold the observed latency into the estimate."""
+        self.in_flight = max(0, self.in_flight - 1)
+        if self.latency_ewma == 0.0:
+            self.latency_ewma = latency_seconds
+        else:
+            self.latency_ewma += self.smoothing * (latency_seconds - self.latency_ewma)
+
+    def to_dict(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "latency_ewma": self.latency_ewma,
+            "overloaded": self.overloaded
+        }
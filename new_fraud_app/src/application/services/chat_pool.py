@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+class ChatPool:
+    """Pool of group chats so each transaction gets an isolated conversation.
+
+    A leased chat is never shared between transactions. On release it is
+    reset in the background (off the decision path) and returned to the idle
+    list; chats that fail to reset, have served ``max_uses`` transactions or
+    do not fit in ``max_idle`` are dropped and replaced on demand.
+
+    Because the reset runs in the background, a lease that immediately
+    follows a release usually finds the idle list empty and creates a new
+    chat. The pool therefore settles at roughly peak concurrency plus the
+    chats still being reset, rather than one chat per sequential caller.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_idle: int = 32, max_uses: int = 100):
+        self.factory = factory
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self.created = 0
+        self.recycled = 0
+        self.discarded = 0
+        self._idle: List[Tuple[Any, int]] = []
+        self._resets: Set[asyncio.Task] = set()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Any]:
+        """Borrow a clean chat for the duration of one transaction."""
+        if self._idle:
+            chat, uses = self._idle.pop()
+        else:
+            chat, uses = self.factory(), 0
+            self.created += 1
+        try:
+            yield chat
+        finally:
+            task = asyncio.get_running_loop().create_task(self._recycle(chat, uses + 1))
+            self._resets.add(task)
+            task.add_done_callback(self._resets.discard)
+
+    async def close(self) -> None:
+        """Wait for pending resets and drop all idle chats."""
+        if self._resets:
+            await asyncio.gather(*self._resets, return_exceptions=True)
+        self._idle.clear()
+
+    def to_dict(self) -> dict:
+        return {
+            "idle": len(self._idle),
+            "created": self.created,
+            "recycled": self.recycled,
+            "discarded": self.discarded
+        }
+
+    async def _recycle(self, chat: Any, uses: int) -> None:
+        try:
+            await chat.reset()
+            chat.is_complete = False
+        except Exception as e:
+            self.discarded += 1
+            logger.warning(f"Discarding chat that failed to reset: {str(e)}")
+            return
+        if uses >= self.max_uses or len(self._idle) >= self.max_idle:
+            self.discarded += 1
+            return
+        self.recycled += 1
+        self._idle.append((chat, uses))
@@ -1,41 +1,266 @@
-from typing import Dict, Any, List
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
 from semantic_kernel.agents import AgentGroupChat
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 
 from ...domain.interfaces.agent_interface import AgentInterface
+from ...domain.interfaces.location_checker_interface import LocationCheckerInterface
+from ...domain.interfaces.merchant_risk_interface import MerchantRiskInterface
+from ...domain.interfaces.result_sink_interface import ResultSinkInterface
 from ...domain.entities.transaction import Transaction
+from ...domain.value_objects.deadline import Deadline
 from ...domain.value_objects.fraud_risk import FraudRisk, RiskLevel
+from ...domain.value_objects.location_anomaly import LocationAnomaly
+from .admission_controller import AdmissionController
+from .chat_pool import ChatPool
+
+@dataclass
+class LoadStats:
+    """Counters for how transactions left the service."""
+    processed: int = 0
+    shed: int = 0
+    timeouts: int = 0
+    sink_rejected: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "shed": self.shed,
+            "timeouts": self.timeouts,
+            "sink_rejected": self.sink_rejected
+        }
 
 class FraudDetectionService:
-    """Service coordinating fraud detection workflow."""
+    """Service coordinating fraud detection workflow.
+
+    Every transaction carries a Deadline. Each agent turn gets an even share
+    of the time left across the turns still expected (one per agent), so
+    time a fast turn does not use rolls over to later ones. A turn that
+    overruns its share is cancelled and ends the whole conversation with the
+    rules-only verdict. The conversation is also capped at ``max_turns``
+    turns. The optional AdmissionController sheds load to the same
+    rules-only path before any agent is called.
+
+    Conversations are leased per transaction from a ChatPool, so history
+    never accumulates across transactions in a long-running process.
+    """
 
-    def __init__(self, agents: List[AgentInterface]):
+    def __init__(
+        self,
+        agents: List[AgentInterface],
+        location_checker: Optional[LocationCheckerInterface] = None,
+        result_sink: Optional[ResultSinkInterface] = None,
+        admission: Optional[AdmissionController] = None,
+        decision_deadline: float = 2.0,
+        max_turns: int = 4,
+        chat_pool: Optional[ChatPool] = None,
+        merchant_index: Optional[MerchantRiskInterface] = None
+    ):
         self.agents = agents
-        self.group_chat = AgentGroupChat()
+        self.location_checker = location_checker
+        self.merchant_index = merchant_index
+        self.result_sink = result_sink
+        self.admission = admission
+        self.decision_deadline = decision_deadline
+        self.max_turns = max_turns
+        self.load_stats = LoadStats()
+        self.chat_pool = chat_pool or ChatPool(AgentGroupChat)
 
-    async def process_transaction(self, transaction: Transaction) -> FraudRisk:
+    async def process_transaction(
+        self, transaction: Transaction, deadline: Optional[Deadline] = None
+    ) -> FraudRisk:
         """Process a transaction through the fraud detection workflow."""
-        # Initialize conversation
-        initial_message = ChatMessageContent(
-            role=AuthorRole.USER,
-            content=f"Transaction ID: {transaction.transaction_id}\nData: {transaction.to_dict()}"
-        )
-        await self.group_chat.add_chat_message(initial_message)
-
-        # Process through agents
-        async for message in self.group_chat.invoke(transaction.to_dict()):
-            if "High fraud likelihood detected" in message.content:
-                return FraudRisk(
-                    level=RiskLevel.HIGH,
-                    score=0.9,
-                    reasons=["High risk transaction detected"],
-                    confidence=0.95
-                )
+        anomaly = self.location_checker.assess(transaction) if self.location_checker is not None else None
+        return await self._process(transaction, deadline, anomaly)
+
+    async def process_batch(
+        self, transactions: List[Transaction], deadline: Optional[Deadline] = None
+    ) -> List[FraudRisk]:
+        """Process a batch concurrently, pre-screening locations in one vectorized pass."""
+        if self.location_checker is not None:
+            anomalies = self.location_checker.assess_batch(transactions)
+        else:
+            anomalies = [None] * len(transactions)
+        return list(await asyncio.gather(*(
+            self._process(transaction, deadline, anomaly)
+            for transaction, anomaly in zip(transactions, anomalies)
+        )))
+
+    async def _process(
+        self,
+        transaction: Transaction,
+        deadline: Optional[Deadline],
+        anomaly: Optional[LocationAnomaly]
+    ) -> FraudRisk:
+        """Admit, score and persist one transaction whose location check is done."""
+        deadline = deadline or Deadline.after(self.decision_deadline)
+        hints, flags, metadata = self._prescreen(transaction, anomaly)
+        transcript: List[str] = []
+
+        if self.admission is not None and not self.admission.try_admit():
+            self.load_stats.shed += 1
+            fraud_risk = self._rules_verdict(flags, metadata, "shed")
+        else:
+            started = time.monotonic()
+            try:
+                fraud_risk = await self._run_agents(transaction, hints, flags, metadata, deadline, transcript)
+            finally:
+                if self.admission is not None:
+                    self.admission.release(time.monotonic() - started)
+
+        self.load_stats.processed += 1
+        # Never wait on the sink: a full buffer costs the record, not the decision.
+        if self.result_sink is not None:
+            if not self.result_sink.offer(transaction.transaction_id, fraud_risk, "\n".join(transcript)):
+                self.load_stats.sink_rejected += 1
+        return fraud_risk
+
+    def get_load_stats(self) -> dict:
+        """Shed/timeout/sink counters, plus admission state when load shedding is enabled."""
+        stats = self.load_stats.to_dict()
+        if self.result_sink is not None:
+            stats["sink_backpressured"] = self.result_sink.is_backpressured
+        if self.admission is not None:
+            stats.update(self.admission.to_dict())
+        stats["chat_pool"] = self.chat_pool.to_dict()
+        return stats
+
+    async def _run_agents(
+        self,
+        transaction: Transaction,
+        hints: List[str],
+        flags: List[str],
+        metadata: Dict[str, Any],
+        deadline: Deadline,
+        transcript: List[str]
+    ) -> FraudRisk:
+        """Run the agent conversation, falling back to rules once the deadline passes.
+
+        The whole conversation, including posting the initial message and
+        closing the turn stream, is bounded by the deadline; individual turns
+        are additionally bounded by their share of it.
+        """
+        try:
+            high_risk = await asyncio.wait_for(
+                self._converse(transaction, hints, deadline, transcript),
+                timeout=deadline.remaining()
+            )
+        except asyncio.TimeoutError:
+            self.load_stats.timeouts += 1
+            return self._rules_verdict(flags, metadata, "timeout")
+        return self._verdict(high_risk, flags, metadata)
+
+    async def _converse(
+        self,
+        transaction: Transaction,
+        hints: List[str],
+        deadline: Deadline,
+        transcript: List[str]
+    ) -> bool:
+        """Drive one leased chat; returns True if the agents reported high risk."""
+        async with self.chat_pool.lease() as group_chat:
+            # Initialize conversation
+            content = f"Transaction ID: {transaction.transaction_id}\nData: {transaction.to_dict()}"
+            if hints:
+                content += "\nPre-screen: " + "; ".join(hints)
+            initial_message = ChatMessageContent(role=AuthorRole.USER, content=content)
+            await group_chat.add_chat_message(initial_message)
+
+            # Process through agents, giving each turn its share of the deadline
+            turns = group_chat.invoke(transaction.to_dict()).__aiter__()
+            expected_turns = len(self.agents) or self.max_turns
+            high_risk = False
+            try:
+                for turn in range(self.max_turns):
+                    timeout = deadline.share(max(1, expected_turns - turn))
+                    try:
+                        message = await asyncio.wait_for(turns.__anext__(), timeout=timeout)
+                    except StopAsyncIteration:
+                        break
+                    transcript.append(message.content)
+                    if "High fraud likelihood detected" in message.content:
+                        high_risk = True
+                        break
+            finally:
+                await turns.aclose()
+
+        return high_risk
+
+    def _verdict(self, high_risk: bool, flags: List[str], metadata: Dict[str, Any]) -> FraudRisk:
+        """Combine the agents' outcome with the pre-screen flags."""
+        if high_risk:
+            return FraudRisk(
+                level=RiskLevel.HIGH,
+                score=0.9,
+                reasons=["High risk transaction detected"] + flags,
+                confidence=0.95,
+                metadata=metadata or None
+            )
+
+        if flags:
+            return FraudRisk(
+                level=RiskLevel.MEDIUM,
+                score=0.5,
+                reasons=flags,
+                confidence=0.8,
+                metadata=metadata
+            )
 
         return FraudRisk(
             level=RiskLevel.LOW,
             score=0.1,
             reasons=["No suspicious patterns detected"],
-            confidence=0.95
-        )
\ No newline at end of file
+            confidence=0.95,
+            metadata=metadata or None
+        )
+
+    def _rules_verdict(self, flags: List[str], metadata: Dict[str, Any], degraded: str) -> FraudRisk:
+        """Fallback verdict from the pre-screen alone, used when the agents are skipped or too slow."""
+        metadata = dict(metadata, degraded=degraded)
+        if flags:
+            return FraudRisk(
+                level=RiskLevel.MEDIUM,
+                score=0.5,
+                reasons=flags,
+                confidence=0.6,
+                metadata=metadata
+            )
+
+        return FraudRisk(
+            level=RiskLevel.LOW,
+            score=0.2,
+            reasons=[f"Rules-only assessment ({degraded}): no suspicious patterns detected"],
+            confidence=0.5,
+            metadata=metadata
+        )
+
+    def _prescreen(
+        self, transaction: Transaction, anomaly: Optional[LocationAnomaly]
+    ) -> Tuple[List[str], List[str], Dict[str, Any]]:
+        """Run the fast deterministic checks that precede the agent conversation.
+
+        ``anomaly`` is the already-computed location check. Returns prompt
+        hints, risk flags and structured metadata.
+        """
+        hints: List[str] = []
+        flags: List[str] = []
+        metadata: Dict[str, Any] = {}
+
+        if anomaly is not None:
+            hints.append(f"location {anomaly.describe()}")
+            metadata["location_anomaly"] = anomaly.to_dict()
+            if anomaly.impossible:
+                flags.append(f"Location anomaly: {anomaly.describe()}")
+
+        if self.merchant_index is not None:
+            merchant_risk = self.merchant_index.lookup(transaction.merchant)
+            if merchant_risk is not None:
+                hints.append(f"merchant {merchant_risk.describe()}")
+                metadata["merchant_risk"] = merchant_risk.to_dict()
+                if merchant_risk.is_high_risk():
+                    flags.append(f"High-risk merchant category: {merchant_risk.category}")
+
+        return hints, flags, metadata
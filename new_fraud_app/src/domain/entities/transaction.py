@@ -14,6 +14,7 @@ class Transaction:
     currency: str = "USD"
     status: str = "pending"
     metadata: Optional[Dict[str, Any]] = None
+    account_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert transaction to dictionary format."""
@@ -25,7 +26,8 @@ class Transaction:
             "timestamp": self.timestamp.isoformat(),
             "currency": self.currency,
             "status": self.status,
-            "metadata": self.metadata
+            "metadata": self.metadata,
+            "account_id": self.account_id
         }
 
     @classmethod
@@ -39,5 +41,6 @@ class Transaction:
             timestamp=datetime.fromisoformat(data["timestamp"]) if isinstance(data["timestamp"], str) else data["timestamp"],
             currency=data.get("currency", "USD"),
             status=data.get("status", "pending"),
-            metadata=data.get("metadata")
+            metadata=data.get("metadata"),
+            account_id=data.get("account_id")
         )
\ No newline at end of file
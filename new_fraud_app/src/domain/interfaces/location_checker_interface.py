@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+from ..entities.transaction import Transaction
+from ..value_objects.location_anomaly import LocationAnomaly
+
+class LocationCheckerInterface(ABC):
+    """Interface for per-account location anomaly checks."""
+    
+    @abstractmethod
+    def assess(self, transaction: Transaction) -> Optional[LocationAnomaly]:
+        """Compare a transaction with the account's previous location."""
+        pass
+
+    def assess_batch(self, transactions: Sequence[Transaction]) -> List[Optional[LocationAnomaly]]:
+        """Assess transactions in arrival order; implementations may vectorize this."""
+        return [self.assess(transaction) for transaction in transactions]
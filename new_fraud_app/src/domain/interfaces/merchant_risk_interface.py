@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..value_objects.merchant_risk import MerchantRisk
+
+class MerchantRiskInterface(ABC):
+    """Interface for merchant category and risk-tier lookups."""
+    
+    @abstractmethod
+    def lookup(self, merchant: str) -> Optional[MerchantRisk]:
+        """Resolve a free-text merchant name to its category and risk tier."""
+        pass
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..value_objects.fraud_risk import FraudRisk
+
+class ResultSinkInterface(ABC):
+    """Interface for persisting fraud verdicts for downstream systems."""
+    
+    @abstractmethod
+    async def submit(self, transaction_id: str, fraud_risk: FraudRisk, report: Optional[str] = None) -> None:
+        """Queue a verdict (and optional report text), waiting for room if needed."""
+        pass
+
+    @abstractmethod
+    def offer(self, transaction_id: str, fraud_risk: FraudRisk, report: Optional[str] = None) -> bool:
+        """Queue a verdict without waiting; returns False if it was rejected."""
+        pass
+
+    @property
+    @abstractmethod
+    def is_backpressured(self) -> bool:
+        """True when the sink is falling behind and producers should slow down."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Flush pending verdicts and release resources."""
+        pass
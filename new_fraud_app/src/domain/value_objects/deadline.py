@@ -0,0 +1,23 @@
+import time
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class Deadline:
+    """Value object for the point in time (monotonic clock) a decision is due."""
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> 'Deadline':
+        """Create a deadline ``seconds`` from now."""
+        return cls(expires_at=time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def share(self, parts: int) -> float:
+        """Even share of the remaining time across ``parts`` pending steps."""
+        return self.remaining() / max(1, parts)
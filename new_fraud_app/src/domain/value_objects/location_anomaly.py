@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(frozen=True)
+class LocationAnomaly:
+    """Value object describing the travel between two consecutive transactions."""
+    account_id: str
+    previous_location: str
+    current_location: str
+    distance_km: float
+    elapsed_hours: float
+    speed_kmh: Optional[float]  # None when both events share a timestamp
+    impossible: bool
+
+    def describe(self) -> str:
+        """Return a short, prompt-friendly summary of the travel check."""
+        verdict = "IMPOSSIBLE TRAVEL" if self.impossible else "plausible travel"
+        speed = "simultaneous" if self.speed_kmh is None else f"{self.speed_kmh:.0f} km/h"
+        return (
+            f"{verdict}: {self.previous_location} -> {self.current_location}, "
+            f"{self.distance_km:.0f} km in {self.elapsed_hours:.2f} h ({speed})"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "account_id": self.account_id,
+            "previous_location": self.previous_location,
+            "current_location": self.current_location,
+            "distance_km": self.distance_km,
+            "elapsed_hours": self.elapsed_hours,
+            "speed_kmh": self.speed_kmh,
+            "impossible": self.impossible
+        }
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from .fraud_risk import RiskLevel
+
+@dataclass(frozen=True)
+class MerchantRisk:
+    """Value object describing a merchant's category and risk tier."""
+    merchant: str
+    matched_name: str
+    category: str
+    tier: RiskLevel
+
+    def is_high_risk(self) -> bool:
+        return self.tier == RiskLevel.HIGH
+
+    def describe(self) -> str:
+        """Return a short, prompt-friendly summary of the merchant lookup."""
+        return f"category={self.category} tier={self.tier.value}"
+
+    def to_dict(self) -> dict:
+        return {
+            "merchant": self.merchant,
+            "matched_name": self.matched_name,
+            "category": self.category,
+            "tier": self.tier.value
+        }
@@ -20,6 +20,7 @@ class VerificationAgent(AgentInterface):
         2. High risk: "VERIFICATION_AGENT > High fraud likelihood detected."
         3. Low risk: "VERIFICATION_AGENT > No fraud detected."
         4. Prefix all messages with: "VERIFICATION_AGENT > {transaction_id} | "
+        5. A "Pre-screen:" line carries precomputed facts (merchant category and risk tier, travel speed); use them instead of guessing from free text.
         """
 
     async def process(self, transaction: Dict[str, Any]) -> ChatMessageContent:
@@ -14,6 +14,36 @@ class Settings(BaseSettings):
     VERIFICATION_AGENT_NAME: str = "VERIFICATION_AGENT"
     REPORT_AGENT_NAME: str = "REPORT_GENERATION_AGENT"
     
+    # Location Anomaly Settings
+    GAZETTEER_PATH: Optional[str] = None
+    MAX_TRAVEL_SPEED_KMH: float = 900.0
+    MIN_TRAVEL_DISTANCE_KM: float = 100.0
+    
+    # Merchant Risk Settings
+    MERCHANT_INDEX_PATH: Optional[str] = None
+    
+    # Result Sink Settings
+    RESULT_SINK_PATH: Optional[str] = None
+    RESULT_SINK_FORMAT: str = "jsonl"
+    RESULT_SINK_BATCH_SIZE: int = 500
+    RESULT_SINK_FLUSH_INTERVAL: float = 1.0
+    RESULT_SINK_MAX_PENDING: int = 10000
+    
+    # Deadline and Load Shedding Settings
+    DECISION_DEADLINE_SECONDS: float = 2.0
+    MAX_AGENT_TURNS: int = 4
+    MAX_IN_FLIGHT: int = 32
+    LATENCY_SHED_THRESHOLD_SECONDS: float = 1.5
+    
+    # Chat Pool Settings
+    CHAT_POOL_MAX_IDLE: int = 32
+    CHAT_MAX_USES: int = 100
+    
+    # Soak / Memory Profiling Settings
+    SOAK_TRANSACTIONS: int = 0
+    MEMORY_PROFILE: bool = False
+    MEMORY_REPORT_EVERY: int = 1000
+    
     # Logging Settings
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
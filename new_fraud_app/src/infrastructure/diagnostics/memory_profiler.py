@@ -0,0 +1,84 @@
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+@dataclass
+class MemoryReport:
+    """Memory retained since profiling started, normalized per transaction."""
+    transactions: int
+    retained_bytes: int
+    peak_bytes: int
+    top_allocations: List[str] = field(default_factory=list)
+
+    @property
+    def bytes_per_transaction(self) -> float:
+        return self.retained_bytes / self.transactions if self.transactions else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "transactions": self.transactions,
+            "retained_bytes": self.retained_bytes,
+            "bytes_per_transaction": self.bytes_per_transaction,
+            "peak_bytes": self.peak_bytes,
+            "top_allocations": self.top_allocations
+        }
+
+class MemoryProfiler:
+    """tracemalloc-based leak check for long soak runs.
+
+    Call ``record()`` after each processed transaction; every
+    ``report_every`` transactions it collects garbage, compares the traced
+    heap with the baseline taken at ``start()`` and returns a MemoryReport.
+    A flat ``bytes_per_transaction`` across reports means nothing is
+    accumulating per transaction.
+    """
+
+    def __init__(self, report_every: int = 1000, top: int = 10, frames: int = 5):
+        self.report_every = report_every
+        self.top = top
+        self.frames = frames
+        self.transactions = 0
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._baseline_bytes = 0
+        self._owns_tracing = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+        gc.collect()
+        self.transactions = 0
+        self._baseline = tracemalloc.take_snapshot()
+        self._baseline_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def record(self) -> Optional[MemoryReport]:
+        """Count one processed transaction; returns a report when one is due."""
+        self.transactions += 1
+        if self.transactions % self.report_every == 0:
+            return self.report()
+        return None
+
+    def report(self) -> MemoryReport:
+        if self._baseline is None:
+            raise RuntimeError("MemoryProfiler.start() must be called first")
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__)
+        ])
+        growth = snapshot.compare_to(self._baseline, "lineno")
+        return MemoryReport(
+            transactions=self.transactions,
+            retained_bytes=current - self._baseline_bytes,
+            peak_bytes=peak,
+            top_allocations=[str(stat) for stat in growth if stat.size_diff > 0][:self.top]
+        )
+
+    def stop(self) -> None:
+        """Drop the baseline; tracing is only stopped if ``start()`` turned it on."""
+        self._baseline = None
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
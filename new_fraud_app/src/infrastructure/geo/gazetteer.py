@@ -0,0 +1,50 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from ..lookup.sorted_table import BoundedCache, SortedMmapTable, fold_text
+
+MAGIC = b"GAZ1"
+NAME_BYTES = 32
+RECORD_DTYPE = np.dtype([("name", f"S{NAME_BYTES}"), ("lat", "<f4"), ("lon", "<f4")])
+
+@lru_cache(maxsize=65536)
+def normalize_location(location: str) -> str:
+    """Normalize a free-text location ("São Paulo, BR" -> "sao paulo br")."""
+    return fold_text(location)
+
+class Gazetteer:
+    """Offline, memory-mapped lookup from location names to coordinates."""
+
+    def __init__(self, path: Union[str, Path], max_cache_size: int = 100_000):
+        self.path = Path(path)
+        self._table = SortedMmapTable(self.path, MAGIC, RECORD_DTYPE, kind="gazetteer")
+        self._cache: BoundedCache[str, Optional[Tuple[float, float]]] = BoundedCache(max_cache_size)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def resolve(self, location: str) -> Optional[Tuple[float, float]]:
+        """Return (latitude, longitude) for a location string, or None if unknown."""
+        try:
+            return self._cache[location]
+        except KeyError:
+            pass
+        record = self._table.find(normalize_location(location))
+        coords = (float(record["lat"]), float(record["lon"])) if record is not None else None
+        return self._cache.put(location, coords)
+
+    @staticmethod
+    def build(entries: Iterable[Tuple[str, float, float]], path: Union[str, Path]) -> Path:
+        """Write (name, latitude, longitude) entries to a gazetteer file.
+
+        Names are normalized before writing; aliases such as "NYC" can be
+        supplied as additional entries pointing at the same coordinates.
+        """
+        rows = (
+            (normalize_location(name).encode("ascii")[:NAME_BYTES], lat, lon)
+            for name, lat, lon in entries
+        )
+        return SortedMmapTable.write(path, MAGIC, RECORD_DTYPE, rows)
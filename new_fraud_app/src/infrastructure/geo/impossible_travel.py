@@ -0,0 +1,142 @@
+import math
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...domain.entities.transaction import Transaction
+from ...domain.interfaces.location_checker_interface import LocationCheckerInterface
+from ...domain.value_objects.location_anomaly import LocationAnomaly
+from .gazetteer import Gazetteer
+
+EARTH_RADIUS_KM = 6371.0088
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in kilometres; accepts scalars or equal-length arrays."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2.0) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def _haversine_scalar_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    # Plain-math twin of haversine_km; numpy call overhead dominates for a single pair.
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2.0) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, max(0.0, a))))
+
+# (location, latitude, longitude, epoch seconds) of an account's latest transaction
+_LastSeen = Tuple[str, float, float, float]
+
+class ImpossibleTravelDetector(LocationCheckerInterface):
+    """Flags accounts whose consecutive transactions imply an impossible travel speed.
+
+    Only the latest event per account is remembered. Late (out-of-order)
+    events are compared against it by absolute time gap and never replace it.
+    The state is an LRU bounded by ``max_accounts``; entries older than
+    ``max_age_hours`` are dropped, since no travel is impossible after that.
+    ``assess`` is the scalar per-event path; ``assess_batch`` computes all
+    distances of a batch in one vectorized pass.
+    """
+
+    def __init__(
+        self,
+        gazetteer: Gazetteer,
+        max_speed_kmh: float = 900.0,
+        min_distance_km: float = 100.0,
+        max_accounts: int = 1_000_000,
+        max_age_hours: float = 24.0
+    ):
+        self.gazetteer = gazetteer
+        self.max_speed_kmh = max_speed_kmh
+        self.min_distance_km = min_distance_km
+        self.max_accounts = max_accounts
+        self.max_age_seconds = max_age_hours * 3600.0
+        self._last_seen: "OrderedDict[str, _LastSeen]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._last_seen)
+
+    def assess(self, transaction: Transaction) -> Optional[LocationAnomaly]:
+        """Check one transaction against the account's latest location and record it."""
+        current = self._locate(transaction)
+        if current is None:
+            return None
+        previous = self._observe(transaction.account_id, current)
+        if previous is None:
+            return None
+        distance = _haversine_scalar_km(previous[1], previous[2], current[1], current[2])
+        return self._anomaly(transaction.account_id, previous, current, distance)
+
+    def assess_batch(self, transactions: Sequence[Transaction]) -> List[Optional[LocationAnomaly]]:
+        """Check a batch of transactions (in arrival order) with one vectorized distance pass."""
+        results: List[Optional[LocationAnomaly]] = [None] * len(transactions)
+        pairs: List[Tuple[int, str, _LastSeen, _LastSeen]] = []
+        for position, transaction in enumerate(transactions):
+            current = self._locate(transaction)
+            if current is None:
+                continue
+            previous = self._observe(transaction.account_id, current)
+            if previous is not None:
+                pairs.append((position, transaction.account_id, previous, current))
+        if not pairs:
+            return results
+
+        distances = haversine_km(
+            [previous[1] for _, _, previous, _ in pairs],
+            [previous[2] for _, _, previous, _ in pairs],
+            [current[1] for _, _, _, current in pairs],
+            [current[2] for _, _, _, current in pairs]
+        )
+        for (position, account_id, previous, current), distance in zip(pairs, distances.tolist()):
+            results[position] = self._anomaly(account_id, previous, current, distance)
+        return results
+
+    def forget(self, account_id: str) -> None:
+        """Drop the remembered location for an account."""
+        self._last_seen.pop(account_id, None)
+
+    def _locate(self, transaction: Transaction) -> Optional[_LastSeen]:
+        if not transaction.account_id:
+            return None
+        coords = self.gazetteer.resolve(transaction.location)
+        if coords is None:
+            return None
+        return transaction.location, coords[0], coords[1], transaction.timestamp.timestamp()
+
+    def _observe(self, account_id: str, current: _LastSeen) -> Optional[_LastSeen]:
+        """Return the account's still-relevant latest event, recording ``current`` if it is newer."""
+        previous = self._last_seen.get(account_id)
+        if previous is not None and abs(current[3] - previous[3]) > self.max_age_seconds:
+            if current[3] < previous[3]:
+                return None
+            previous = None
+        if previous is None or current[3] >= previous[3]:
+            self._last_seen[account_id] = current
+        self._last_seen.move_to_end(account_id)
+        self._evict(current[3])
+        return previous
+
+    def _evict(self, now: float) -> None:
+        while len(self._last_seen) > self.max_accounts:
+            self._last_seen.popitem(last=False)
+        # Least recently seen first, so stop at the first entry still in range.
+        while self._last_seen:
+            oldest = next(iter(self._last_seen.values()))
+            if now - oldest[3] <= self.max_age_seconds:
+                break
+            self._last_seen.popitem(last=False)
+
+    def _anomaly(
+        self, account_id: str, previous: _LastSeen, current: _LastSeen, distance: float
+    ) -> LocationAnomaly:
+        elapsed_hours = abs(current[3] - previous[3]) / 3600.0
+        speed = distance / elapsed_hours if elapsed_hours > 0 else None
+        too_fast = speed > self.max_speed_kmh if speed is not None else distance > 0
+        return LocationAnomaly(
+            account_id=account_id,
+            previous_location=previous[0],
+            current_location=current[0],
+            distance_km=distance,
+            elapsed_hours=elapsed_hours,
+            speed_kmh=speed,
+            impossible=distance >= self.min_distance_km and too_fast
+        )
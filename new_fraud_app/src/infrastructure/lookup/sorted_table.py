@@ -0,0 +1,89 @@
+import re
+import struct
+import unicodedata
+from pathlib import Path
+from typing import Dict, Generic, Iterable, Optional, Tuple, TypeVar, Union
+
+import numpy as np
+
+HEADER = struct.Struct("<4sI")
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+def fold_text(text: str) -> str:
+    """Lowercase, strip accents and collapse punctuation to single spaces."""
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub(" ", folded.lower()).strip()
+
+class SortedMmapTable:
+    """Fixed-width records sorted by a ``name`` field, memory-mapped from disk.
+
+    The file is a 4-byte magic, a record count and the raw records, so a
+    lookup is a binary search over the mapped pages and the file is never
+    read into memory as a whole.
+    """
+
+    def __init__(self, path: Union[str, Path], magic: bytes, dtype: np.dtype, kind: str = "lookup table"):
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            file_magic, count = HEADER.unpack(handle.read(HEADER.size))
+        if file_magic != magic:
+            raise ValueError(f"{self.path} is not a {kind} file")
+        if count:
+            self.records = np.memmap(self.path, dtype=dtype, mode="r", offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=dtype)
+        self.names = self.records["name"]
+        self.name_bytes = dtype["name"].itemsize
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def find(self, name: str) -> Optional[np.void]:
+        """Return the record whose name equals ``name`` (truncated to the field width)."""
+        key = name.encode("ascii")[:self.name_bytes]
+        index = int(np.searchsorted(self.names, key))
+        if index < len(self.names) and self.names[index] == key:
+            return self.records[index]
+        return None
+
+    @staticmethod
+    def write(
+        path: Union[str, Path], magic: bytes, dtype: np.dtype, rows: Iterable[Tuple[bytes, ...]]
+    ) -> Path:
+        """Write rows (name first) to a table file; later duplicates of a name win."""
+        unique: Dict[bytes, Tuple[bytes, ...]] = {}
+        for row in rows:
+            if row[0]:
+                unique[row[0]] = row
+        records = np.array([unique[name] for name in sorted(unique)], dtype=dtype)
+        path = Path(path)
+        with open(path, "wb") as handle:
+            handle.write(HEADER.pack(magic, len(records)))
+            records.tofile(handle)
+        return path
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+class BoundedCache(Generic[K, V]):
+    """Memo dict that is cleared wholesale once it reaches ``max_size`` entries."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: Dict[K, V] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: K) -> V:
+        return self._entries[key]
+
+    def put(self, key: K, value: V) -> V:
+        if len(self._entries) >= self.max_size:
+            self._entries.clear()
+        self._entries[key] = value
+        return value
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from ...domain.interfaces.result_sink_interface import ResultSinkInterface
+from ...domain.value_objects.fraud_risk import FraudRisk
+from .writers import ResultWriter, Row, compress_report
+
+logger = logging.getLogger(__name__)
+
+# (transaction_id, recorded_at, fraud_risk, report) as queued on the event loop
+_Pending = Tuple[str, str, FraudRisk, Optional[str]]
+
+@dataclass
+class SinkStats:
+    """Counters describing sink throughput and pressure."""
+    submitted: int = 0
+    written: int = 0
+    rejected: int = 0
+    failed: int = 0
+    batches: int = 0
+    last_flush_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "batches": self.batches,
+            "last_flush_seconds": self.last_flush_seconds
+        }
+
+class BatchingResultSink(ResultSinkInterface):
+    """Buffers verdicts and flushes them in batches on a dedicated writer thread.
+
+    A batch is flushed when ``batch_size`` verdicts are buffered or
+    ``flush_interval`` seconds have passed, whichever comes first. Row
+    building, report compression and I/O all happen on the writer thread,
+    so the scoring event loop only appends to a list.
+
+    Backpressure: ``is_backpressured`` turns true once pending verdicts reach
+    ``high_watermark`` of ``max_pending``; ``submit`` waits for room when the
+    buffer is full and ``offer`` refuses instead of waiting. After a burst
+    the loop keeps writing full batches back to back until the buffer is
+    below ``batch_size``, so the signal clears as soon as the writer allows.
+
+    The flush loop starts on the first queued verdict if ``start()`` was not
+    called. Once closed, ``offer`` refuses and ``submit`` raises.
+    """
+
+    def __init__(
+        self,
+        writer: ResultWriter,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000,
+        high_watermark: float = 0.8
+    ):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.high_watermark = high_watermark
+        self.stats = SinkStats()
+        self._buffer: List[_Pending] = []
+        self._in_flight = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="result-sink")
+        self._flush_requested = asyncio.Event()
+        self._room = asyncio.Condition()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Verdicts accepted but not yet written."""
+        return len(self._buffer) + self._in_flight
+
+    @property
+    def is_backpressured(self) -> bool:
+        """True when the sink is falling behind and producers should slow down."""
+        return self.pending >= self.max_pending * self.high_watermark
+
+    def start(self) -> None:
+        """Start the background flush loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, transaction_id: str, fraud_risk: FraudRisk, report: Optional[str] = None) -> None:
+        """Queue a verdict, waiting for room if the buffer is full."""
+        if self._closed:
+            raise RuntimeError("Result sink is closed")
+        self.start()
+        if self.pending >= self.max_pending:
+            async with self._room:
+                await self._room.wait_for(lambda: self.pending < self.max_pending or self._closed)
+        self._enqueue(transaction_id, fraud_risk, report)
+
+    def offer(self, transaction_id: str, fraud_risk: FraudRisk, report: Optional[str] = None) -> bool:
+        """Queue a verdict without waiting; returns False if the buffer is full or closed."""
+        if self._closed or self.pending >= self.max_pending:
+            self.stats.rejected += 1
+            return False
+        self.start()
+        self._enqueue(transaction_id, fraud_risk, report)
+        return True
+
+    async def flush(self) -> None:
+        """Write everything currently buffered."""
+        while self._buffer:
+            await self._flush_once()
+
+    async def close(self) -> None:
+        """Stop the flush loop, write remaining verdicts and close the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None:
+            self._flush_requested.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.writer.close)
+        self._executor.shutdown(wait=True)
+        async with self._room:
+            self._room.notify_all()
+
+    def _enqueue(self, transaction_id: str, fraud_risk: FraudRisk, report: Optional[str]) -> None:
+        if self._closed:
+            raise RuntimeError("Result sink is closed")
+        recorded_at = datetime.now(timezone.utc).isoformat()
+        self._buffer.append((transaction_id, recorded_at, fraud_risk, report))
+        self.stats.submitted += 1
+        if len(self._buffer) >= self.batch_size:
+            self._flush_requested.set()
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            if self._buffer:
+                await self._flush_once()
+            # Drain a backlog in full batches instead of one batch per wake-up.
+            while len(self._buffer) >= self.batch_size:
+                await self._flush_once()
+
+    async def _flush_once(self) -> None:
+        batch = self._buffer[:self.batch_size]
+        del self._buffer[:self.batch_size]
+        self._in_flight += len(batch)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self._write, batch)
+            self.stats.written += len(batch)
+            self.stats.batches += 1
+        except Exception as e:
+            self.stats.failed += len(batch)
+            logger.error(f"Failed to write {len(batch)} fraud results: {str(e)}")
+        finally:
+            self._in_flight -= len(batch)
+            self.stats.last_flush_seconds = time.perf_counter() - started
+            async with self._room:
+                self._room.notify_all()
+
+    def _write(self, batch: List[_Pending]) -> None:
+        rows: List[Row] = []
+        for transaction_id, recorded_at, fraud_risk, report in batch:
+            row = fraud_risk.to_dict()
+            row["transaction_id"] = transaction_id
+            row["recorded_at"] = recorded_at
+            row["report"] = compress_report(report)
+            rows.append(row)
+        self.writer.write_batch(rows)
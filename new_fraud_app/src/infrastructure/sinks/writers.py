@@ -0,0 +1,150 @@
+import base64
+import json
+import sqlite3
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# A row as produced by BatchingResultSink; "report" holds zlib-compressed bytes or None.
+Row = Dict[str, Any]
+
+def compress_report(report: Optional[str]) -> Optional[bytes]:
+    """Compress report text for storage."""
+    if not report:
+        return None
+    return zlib.compress(report.encode("utf-8"), 6)
+
+def decompress_report(blob: Optional[bytes]) -> Optional[str]:
+    """Inverse of compress_report."""
+    if blob is None:
+        return None
+    return zlib.decompress(blob).decode("utf-8")
+
+class ResultWriter(ABC):
+    """Synchronous batch writer; always called from the sink's single writer thread."""
+
+    @abstractmethod
+    def write_batch(self, rows: List[Row]) -> None:
+        """Persist a batch of rows."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finalize the output."""
+        pass
+
+class JsonlResultWriter(ResultWriter):
+    """Appends one JSON object per verdict; reports are base64-encoded zlib."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._handle = None
+
+    def write_batch(self, rows: List[Row]) -> None:
+        if self._handle is None:
+            self._handle = open(self.path, "a", encoding="utf-8")
+        lines = []
+        for row in rows:
+            record = dict(row)
+            if record["report"] is not None:
+                record["report"] = base64.b64encode(record["report"]).decode("ascii")
+            lines.append(json.dumps(record, default=str))
+        self._handle.write("\n".join(lines) + "\n")
+        self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+class SqliteResultWriter(ResultWriter):
+    """Inserts verdicts into a SQLite table, one transaction per batch."""
+
+    def __init__(self, path: Union[str, Path], table: str = "fraud_results"):
+        self.path = Path(path)
+        self.table = table
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened lazily so the connection belongs to the writer thread.
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "transaction_id TEXT, recorded_at TEXT, level TEXT, score REAL, "
+            "confidence REAL, reasons TEXT, metadata TEXT, report BLOB)"
+        )
+        return conn
+
+    def write_batch(self, rows: List[Row]) -> None:
+        if self._conn is None:
+            self._conn = self._connect()
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO {self.table} VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        row["transaction_id"], row["recorded_at"], row["level"], row["score"],
+                        row["confidence"], json.dumps(row["reasons"]),
+                        json.dumps(row["metadata"], default=str), row["report"]
+                    )
+                    for row in rows
+                ]
+            )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+class ParquetResultWriter(ResultWriter):
+    """Streams batches as row groups into a single Parquet file (requires pyarrow)."""
+
+    def __init__(self, path: Union[str, Path]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet result sink requires pyarrow: pip install pyarrow") from e
+        self._pa = pa
+        self._pq = pq
+        self.path = Path(path)
+        self.schema = pa.schema([
+            ("transaction_id", pa.string()),
+            ("recorded_at", pa.string()),
+            ("level", pa.string()),
+            ("score", pa.float64()),
+            ("confidence", pa.float64()),
+            ("reasons", pa.list_(pa.string())),
+            ("metadata", pa.string()),
+            ("report", pa.binary())
+        ])
+        self._writer = None
+
+    def write_batch(self, rows: List[Row]) -> None:
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, self.schema, compression="zstd")
+        columns = {name: [row[name] for row in rows] for name in self.schema.names}
+        columns["metadata"] = [json.dumps(value, default=str) for value in columns["metadata"]]
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self.schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+WRITERS = {
+    "jsonl": JsonlResultWriter,
+    "sqlite": SqliteResultWriter,
+    "parquet": ParquetResultWriter
+}
+
+def create_writer(format: str, path: Union[str, Path]) -> ResultWriter:
+    """Create a writer for one of the supported formats."""
+    try:
+        writer_class = WRITERS[format.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported result sink format: {format}") from None
+    return writer_class(path)
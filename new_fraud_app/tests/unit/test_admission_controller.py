@@ -0,0 +1,27 @@
+from src.application.services.admission_controller import AdmissionController
+
+def test_sheds_when_in_flight_limit_reached():
+    controller = AdmissionController(max_in_flight=2)
+    assert controller.try_admit()
+    assert controller.try_admit()
+    assert not controller.try_admit()
+    controller.release(0.1)
+    assert controller.try_admit()
+
+def test_narrows_limit_while_latency_is_high():
+    controller = AdmissionController(max_in_flight=8, latency_threshold=1.0, degraded_in_flight=1)
+    assert controller.try_admit()
+    controller.release(5.0)
+    assert controller.overloaded
+    assert controller.try_admit()
+    assert not controller.try_admit()
+
+def test_recovers_once_latency_drops():
+    controller = AdmissionController(max_in_flight=8, latency_threshold=1.0, smoothing=0.5)
+    controller.try_admit()
+    controller.release(2.0)
+    assert controller.overloaded
+    for _ in range(5):
+        assert controller.try_admit()
+        controller.release(0.1)
+    assert not controller.overloaded
@@ -0,0 +1,163 @@
+import asyncio
+import base64
+import json
+import sqlite3
+
+import pytest
+
+from src.domain.value_objects.fraud_risk import FraudRisk, RiskLevel
+from src.infrastructure.sinks.batching_sink import BatchingResultSink
+from src.infrastructure.sinks.writers import ResultWriter, create_writer, decompress_report
+
+RISK = FraudRisk(level=RiskLevel.HIGH, score=0.9, reasons=["test"], confidence=0.95)
+
+class RecordingWriter(ResultWriter):
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def write_batch(self, rows):
+        self.batches.append(rows)
+
+    def close(self):
+        self.closed = True
+
+def test_flushes_when_batch_size_reached():
+    async def scenario():
+        writer = RecordingWriter()
+        sink = BatchingResultSink(writer, batch_size=3, flush_interval=60)
+        sink.start()
+        for i in range(3):
+            await sink.submit(f"T{i}", RISK)
+        for _ in range(50):
+            if writer.batches:
+                break
+            await asyncio.sleep(0.01)
+        await sink.close()
+        return writer
+
+    writer = asyncio.run(scenario())
+    assert [len(batch) for batch in writer.batches] == [3]
+
+def test_flushes_after_interval():
+    async def scenario():
+        writer = RecordingWriter()
+        sink = BatchingResultSink(writer, batch_size=100, flush_interval=0.05)
+        sink.start()
+        await sink.submit("T1", RISK)
+        await asyncio.sleep(0.3)
+        flushed = [len(batch) for batch in writer.batches]
+        await sink.close()
+        return flushed
+
+    assert asyncio.run(scenario()) == [1]
+
+def test_offer_refuses_when_full_and_reports_backpressure():
+    async def scenario():
+        sink = BatchingResultSink(RecordingWriter(), batch_size=10, max_pending=2, high_watermark=0.5)
+        assert not sink.is_backpressured
+        assert sink.offer("T1", RISK)
+        assert sink.is_backpressured
+        assert sink.offer("T2", RISK)
+        assert not sink.offer("T3", RISK)
+        assert sink.stats.rejected == 1
+        await sink.close()
+
+    asyncio.run(scenario())
+
+def test_submit_without_start_does_not_hang_when_full():
+    async def scenario():
+        writer = RecordingWriter()
+        sink = BatchingResultSink(writer, batch_size=10, flush_interval=0.05, max_pending=2)
+        for i in range(3):
+            await asyncio.wait_for(sink.submit(f"T{i}", RISK), timeout=1)
+        await sink.close()
+        return writer
+
+    writer = asyncio.run(scenario())
+    assert sum(len(batch) for batch in writer.batches) == 3
+
+def test_close_drains_buffer_and_closes_writer():
+    async def scenario():
+        writer = RecordingWriter()
+        sink = BatchingResultSink(writer, batch_size=2, flush_interval=60)
+        sink.start()
+        for i in range(5):
+            sink.offer(f"T{i}", RISK)
+        await sink.close()
+        return writer, sink
+
+    writer, sink = asyncio.run(scenario())
+    assert sum(len(batch) for batch in writer.batches) == 5
+    assert writer.closed
+    assert sink.pending == 0
+
+def _write_one(writer):
+    async def scenario():
+        sink = BatchingResultSink(writer)
+        await sink.submit("TXN1", RISK, "Fraud report generated.")
+        await sink.close()
+
+    asyncio.run(scenario())
+
+def test_jsonl_round_trip(tmp_path):
+    path = tmp_path / "results.jsonl"
+    _write_one(create_writer("jsonl", path))
+    record = json.loads(path.read_text().strip())
+    assert record["transaction_id"] == "TXN1"
+    assert record["level"] == "high"
+    assert decompress_report(base64.b64decode(record["report"])) == "Fraud report generated."
+
+def test_sqlite_round_trip(tmp_path):
+    path = tmp_path / "results.db"
+    _write_one(create_writer("sqlite", path))
+    with sqlite3.connect(path) as conn:
+        transaction_id, level, report = conn.execute(
+            "SELECT transaction_id, level, report FROM fraud_results"
+        ).fetchone()
+    assert (transaction_id, level) == ("TXN1", "high")
+    assert decompress_report(report) == "Fraud report generated."
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        create_writer("csv", tmp_path / "out.csv")
+
+def test_burst_drains_in_back_to_back_batches():
+    async def scenario():
+        writer = RecordingWriter()
+        sink = BatchingResultSink(writer, batch_size=100, flush_interval=0.5, max_pending=2000)
+        sink.start()
+        for i in range(1000):
+            sink.offer(f"T{i}", RISK)
+        await asyncio.sleep(0.2)
+        pending = sink.pending
+        await sink.close()
+        return pending
+
+    assert asyncio.run(scenario()) == 0
+
+def test_offer_without_start_still_flushes():
+    async def scenario():
+        writer = RecordingWriter()
+        sink = BatchingResultSink(writer, batch_size=2, flush_interval=60, max_pending=2)
+        accepted = []
+        for i in range(6):
+            accepted.append(sink.offer(f"T{i}", RISK))
+            await asyncio.sleep(0.05)
+        await sink.close()
+        return accepted, writer
+
+    accepted, writer = asyncio.run(scenario())
+    assert all(accepted)
+    assert sum(len(batch) for batch in writer.batches) == 6
+
+def test_offer_after_close_is_rejected_not_raised():
+    async def scenario():
+        sink = BatchingResultSink(RecordingWriter())
+        await sink.close()
+        accepted = sink.offer("T1", RISK)
+        with pytest.raises(RuntimeError):
+            await sink.submit("T2", RISK)
+        return accepted, sink.stats.rejected
+
+    assert asyncio.run(scenario()) == (False, 1)
@@ -0,0 +1,88 @@
+import asyncio
+
+from src.application.services.chat_pool import ChatPool
+
+class StubChat:
+    """Stands in for AgentGroupChat; records resets."""
+    fail_reset = False
+
+    def __init__(self):
+        self.resets = 0
+        self.is_complete = True
+
+    async def reset(self):
+        if self.fail_reset:
+            raise RuntimeError("reset failed")
+        self.resets += 1
+
+class FailingChat(StubChat):
+    fail_reset = True
+
+def test_concurrent_leases_get_distinct_chats():
+    async def scenario():
+        pool = ChatPool(StubChat)
+        async with pool.lease() as first, pool.lease() as second:
+            assert first is not second
+        await pool.close()
+        return pool
+
+    assert asyncio.run(scenario()).created == 2
+
+def test_release_resets_chat_and_returns_it_to_the_pool():
+    async def scenario():
+        pool = ChatPool(StubChat)
+        async with pool.lease() as first:
+            pass
+        await asyncio.gather(*pool._resets)
+        async with pool.lease() as second:
+            pass
+        await pool.close()
+        return pool, first, second
+
+    pool, first, second = asyncio.run(scenario())
+    assert first is second
+    assert first.resets == 2
+    assert first.is_complete is False
+    assert pool.to_dict()["recycled"] == 2
+
+def test_chat_is_dropped_after_max_uses():
+    async def scenario():
+        pool = ChatPool(StubChat, max_uses=1)
+        async with pool.lease():
+            pass
+        await pool.close()
+        return pool
+
+    pool = asyncio.run(scenario())
+    assert (pool.recycled, pool.discarded) == (0, 1)
+
+def test_chats_beyond_max_idle_are_dropped():
+    async def scenario():
+        pool = ChatPool(StubChat, max_idle=1)
+        async with pool.lease(), pool.lease():
+            pass
+        await asyncio.gather(*pool._resets)
+        idle = pool.to_dict()["idle"]
+        await pool.close()
+        return pool, idle
+
+    pool, idle = asyncio.run(scenario())
+    assert idle == 1
+    assert (pool.recycled, pool.discarded) == (1, 1)
+
+def test_failed_reset_discards_chat():
+    async def scenario():
+        pool = ChatPool(FailingChat)
+        async with pool.lease() as first:
+            pass
+        await asyncio.gather(*pool._resets)
+        idle = pool.to_dict()["idle"]
+        async with pool.lease() as second:
+            pass
+        await pool.close()
+        return pool, idle, first, second
+
+    pool, idle, first, second = asyncio.run(scenario())
+    assert idle == 0
+    assert first is not second
+    assert pool.discarded == 2
@@ -0,0 +1,20 @@
+import time
+
+import pytest
+
+from src.domain.value_objects.deadline import Deadline
+
+def test_share_splits_remaining_time():
+    deadline = Deadline.after(1.0)
+    assert deadline.share(4) == pytest.approx(0.25, abs=0.01)
+    assert deadline.share(1) == pytest.approx(1.0, abs=0.01)
+
+def test_share_treats_non_positive_parts_as_one():
+    deadline = Deadline.after(1.0)
+    assert deadline.share(0) == pytest.approx(deadline.remaining(), abs=0.01)
+
+def test_expired_deadline_has_no_time_left():
+    deadline = Deadline(expires_at=time.monotonic() - 1)
+    assert deadline.expired()
+    assert deadline.remaining() == 0.0
+    assert deadline.share(3) == 0.0
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("semantic_kernel")
+
+from src.application.services.admission_controller import AdmissionController
+from src.application.services.chat_pool import ChatPool
+from src.application.services.fraud_detection_service import FraudDetectionService
+from src.domain.entities.transaction import Transaction
+from src.domain.value_objects.deadline import Deadline
+from src.domain.value_objects.fraud_risk import RiskLevel
+
+class StubMessage:
+    def __init__(self, content):
+        self.content = content
+
+class StubChat:
+    """Stands in for AgentGroupChat with a fixed delay per turn."""
+    delay = 0.0
+    post_delay = 0.0
+    replies = ["VERIFICATION_AGENT > No fraud detected."]
+
+    def __init__(self):
+        self.messages = []
+        self.is_complete = False
+
+    async def add_chat_message(self, message):
+        await asyncio.sleep(self.post_delay)
+        self.messages.append(message)
+
+    async def invoke(self, *args):
+        for reply in self.replies:
+            await asyncio.sleep(self.delay)
+            yield StubMessage(reply)
+
+    async def reset(self):
+        self.messages.clear()
+
+def make_transaction():
+    return Transaction(
+        transaction_id="TXN1",
+        amount=10,
+        location="New York",
+        merchant="Store",
+        timestamp=datetime(2026, 1, 1)
+    )
+
+def make_pool(delay, replies, post_delay=0.0):
+    chat_class = type("Chat", (StubChat,), {"delay": delay, "replies": replies, "post_delay": post_delay})
+    return ChatPool(chat_class)
+
+def test_high_risk_reply_gives_high_verdict():
+    service = FraudDetectionService(
+        agents=[], chat_pool=make_pool(0.0, ["VERIFICATION_AGENT > High fraud likelihood detected."])
+    )
+    assert asyncio.run(service.process_transaction(make_transaction())).level == RiskLevel.HIGH
+
+def test_slow_turn_falls_back_to_rules_only_verdict():
+    service = FraudDetectionService(agents=[], chat_pool=make_pool(0.5, ["slow"]), max_turns=1)
+    fraud_risk = asyncio.run(service.process_transaction(make_transaction(), Deadline.after(0.1)))
+    assert fraud_risk.metadata["degraded"] == "timeout"
+    assert service.load_stats.timeouts == 1
+
+def test_stalled_initial_message_is_bounded_by_deadline():
+    service = FraudDetectionService(agents=[], chat_pool=make_pool(0.0, ["fast"], post_delay=5.0))
+    started = time.monotonic()
+    fraud_risk = asyncio.run(service.process_transaction(make_transaction(), Deadline.after(0.1)))
+    assert time.monotonic() - started < 1.0
+    assert fraud_risk.metadata["degraded"] == "timeout"
+    assert service.load_stats.timeouts == 1
+
+def test_max_turns_caps_the_conversation():
+    replies = ["ORCHESTRATOR_AGENT > routing"] * 3 + ["VERIFICATION_AGENT > High fraud likelihood detected."]
+    service = FraudDetectionService(agents=[], chat_pool=make_pool(0.0, replies), max_turns=2)
+    assert asyncio.run(service.process_transaction(make_transaction())).level == RiskLevel.LOW
+
+def test_sheds_to_rules_only_verdict_when_full():
+    admission = AdmissionController(max_in_flight=1)
+    admission.try_admit()
+    service = FraudDetectionService(agents=[], chat_pool=make_pool(0.0, []), admission=admission)
+    fraud_risk = asyncio.run(service.process_transaction(make_transaction()))
+    assert fraud_risk.metadata["degraded"] == "shed"
+    assert service.get_load_stats()["shed"] == 1
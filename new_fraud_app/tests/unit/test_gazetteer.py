@@ -0,0 +1,48 @@
+import pytest
+
+from src.infrastructure.geo.gazetteer import Gazetteer, normalize_location
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    path = Gazetteer.build(
+        [
+            ("New York", 40.7128, -74.0060),
+            ("NYC", 40.7128, -74.0060),
+            ("London", 51.5074, -0.1278),
+            ("São Paulo", -23.5505, -46.6333)
+        ],
+        tmp_path / "gazetteer.bin"
+    )
+    return Gazetteer(path)
+
+def test_normalize_location_folds_case_accents_and_punctuation():
+    assert normalize_location("São Paulo, BR") == "sao paulo br"
+    assert normalize_location("  NEW-YORK  ") == "new york"
+
+def test_build_deduplicates_normalized_names(tmp_path):
+    path = Gazetteer.build([("London", 1.0, 2.0), ("LONDON", 3.0, 4.0)], tmp_path / "g.bin")
+    gazetteer = Gazetteer(path)
+    assert len(gazetteer) == 1
+    assert gazetteer.resolve("london") == pytest.approx((3.0, 4.0))
+
+def test_resolve_known_locations_and_aliases(gazetteer):
+    assert gazetteer.resolve("New York") == pytest.approx((40.7128, -74.0060), abs=1e-4)
+    assert gazetteer.resolve("nyc") == gazetteer.resolve("New York")
+    assert gazetteer.resolve("Sao Paulo") == pytest.approx((-23.5505, -46.6333), abs=1e-4)
+
+def test_resolve_unknown_location_returns_none(gazetteer):
+    assert gazetteer.resolve("Atlantis") is None
+    assert gazetteer.resolve("") is None
+
+def test_resolve_cache_is_bounded(tmp_path):
+    path = Gazetteer.build([("London", 51.5, -0.1)], tmp_path / "g.bin")
+    gazetteer = Gazetteer(path, max_cache_size=2)
+    for name in ("a", "b", "c", "London"):
+        gazetteer.resolve(name)
+    assert len(gazetteer._cache) <= 2
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "not-a-gazetteer.bin"
+    path.write_bytes(b"XXXX\x00\x00\x00\x00")
+    with pytest.raises(ValueError):
+        Gazetteer(path)
@@ -0,0 +1,94 @@
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.entities.transaction import Transaction
+from src.infrastructure.geo.gazetteer import Gazetteer
+from src.infrastructure.geo.impossible_travel import ImpossibleTravelDetector, haversine_km
+
+NOON = datetime(2026, 1, 1, 12, 0)
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    path = Gazetteer.build(
+        [("New York", 40.7128, -74.0060), ("London", 51.5074, -0.1278), ("Newark", 40.7357, -74.1724)],
+        tmp_path / "gazetteer.bin"
+    )
+    return Gazetteer(path)
+
+def txn(location, minutes, account_id="ACC1"):
+    return Transaction(
+        transaction_id=f"{location}-{minutes}",
+        amount=10,
+        location=location,
+        merchant="Store",
+        timestamp=NOON + timedelta(minutes=minutes),
+        account_id=account_id
+    )
+
+def test_haversine_known_distance():
+    assert float(haversine_km(40.7128, -74.0060, 51.5074, -0.1278)) == pytest.approx(5570, rel=0.01)
+    assert float(haversine_km(10.0, 10.0, 10.0, 10.0)) == 0.0
+
+def test_haversine_is_vectorized():
+    distances = haversine_km([0.0, 0.0], [0.0, 0.0], [0.0, 1.0], [1.0, 0.0])
+    assert distances.shape == (2,)
+    assert np.allclose(distances, 111.2, rtol=0.01)
+
+def test_first_transaction_has_no_anomaly(gazetteer):
+    assert ImpossibleTravelDetector(gazetteer).assess(txn("New York", 0)) is None
+
+def test_flags_impossible_travel(gazetteer):
+    detector = ImpossibleTravelDetector(gazetteer)
+    detector.assess(txn("New York", 0))
+    anomaly = detector.assess(txn("London", 60))
+    assert anomaly.impossible
+    assert anomaly.speed_kmh == pytest.approx(5570, rel=0.01)
+
+def test_nearby_or_slow_travel_is_plausible(gazetteer):
+    detector = ImpossibleTravelDetector(gazetteer)
+    detector.assess(txn("New York", 0))
+    assert not detector.assess(txn("Newark", 1)).impossible
+    assert not detector.assess(txn("London", 24 * 60)).impossible
+
+def test_out_of_order_event_uses_absolute_gap_and_keeps_latest(gazetteer):
+    detector = ImpossibleTravelDetector(gazetteer)
+    detector.assess(txn("New York", 0))
+    detector.assess(txn("London", 60))
+    late = detector.assess(txn("New York", 30))
+    assert late.elapsed_hours == pytest.approx(0.5)
+    assert late.speed_kmh == pytest.approx(5570 / 0.5, rel=0.01)
+    # The late event must not replace London as the latest location.
+    follow_up = detector.assess(txn("London", 120))
+    assert follow_up.previous_location == "London"
+    assert not follow_up.impossible
+
+def test_simultaneous_events_are_json_safe(gazetteer):
+    detector = ImpossibleTravelDetector(gazetteer)
+    detector.assess(txn("New York", 0))
+    anomaly = detector.assess(txn("London", 0))
+    assert anomaly.impossible
+    assert anomaly.speed_kmh is None
+    json.dumps(anomaly.to_dict(), allow_nan=False)
+
+def test_state_is_bounded_by_account_count_and_age(gazetteer):
+    detector = ImpossibleTravelDetector(gazetteer, max_accounts=2, max_age_hours=1)
+    detector.assess(txn("New York", 0, account_id="A"))
+    detector.assess(txn("New York", 0, account_id="B"))
+    detector.assess(txn("New York", 0, account_id="C"))
+    assert len(detector) == 2
+    detector.assess(txn("London", 180, account_id="D"))
+    assert len(detector) == 1
+
+def test_assess_batch_matches_scalar_path(gazetteer):
+    events = [txn("New York", 0), txn("London", 60), txn("New York", 30), txn("London", 0, account_id="B")]
+    batched = ImpossibleTravelDetector(gazetteer).assess_batch(events)
+    scalar_detector = ImpossibleTravelDetector(gazetteer)
+    scalar = [scalar_detector.assess(event) for event in events]
+    assert [a is None for a in batched] == [a is None for a in scalar]
+    for a, b in zip(batched, scalar):
+        if a is not None:
+            assert a.impossible == b.impossible
+            assert a.distance_km == pytest.approx(b.distance_km)
@@ -0,0 +1,27 @@
+import tracemalloc
+
+from src.infrastructure.diagnostics.memory_profiler import MemoryProfiler
+
+def test_reports_retained_bytes_per_transaction():
+    profiler = MemoryProfiler(report_every=2)
+    profiler.start()
+    try:
+        retained = []
+        assert profiler.record() is None
+        retained.append(bytearray(10_000))
+        report = profiler.record()
+        assert report.transactions == 2
+        assert report.bytes_per_transaction >= 5_000
+    finally:
+        profiler.stop()
+    assert not tracemalloc.is_tracing()
+
+def test_stop_leaves_foreign_tracing_running():
+    tracemalloc.start()
+    try:
+        profiler = MemoryProfiler()
+        profiler.start()
+        profiler.stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
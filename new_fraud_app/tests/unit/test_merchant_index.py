@@ -0,0 +1,72 @@
+import pytest
+
+from src.domain.value_objects.fraud_risk import RiskLevel
+from src.infrastructure.merchants.merchant_index import MerchantIndex, normalize_merchant
+
+@pytest.fixture
+def index(tmp_path):
+    path = MerchantIndex.build(
+        [
+            ("Lucky Star Casino", "gambling", RiskLevel.HIGH),
+            ("Coinbase", "crypto", RiskLevel.HIGH),
+            ("7-Eleven", "convenience", RiskLevel.LOW),
+            ("Op", "unknown", RiskLevel.HIGH)
+        ],
+        tmp_path / "merchants-v1.bin"
+    )
+    return MerchantIndex(path)
+
+def test_normalize_strips_only_trailing_suffixes_and_store_numbers():
+    assert normalize_merchant("Lucky-Star Casino, LLC #42") == "lucky star casino"
+    assert normalize_merchant("COINBASE.COM") == "coinbase"
+    assert normalize_merchant("7-Eleven #1234") == "7 eleven"
+    assert normalize_merchant("24 Hour Fitness") == "24 hour fitness"
+    assert normalize_merchant("Co-op") == "co op"
+    assert normalize_merchant("Co") == "co"
+    assert normalize_merchant("Lucky Star Casino Store 12") == "lucky star casino"
+    assert normalize_merchant("Lucky Star Casino No. 5") == "lucky star casino"
+
+def test_normalize_keeps_numbers_that_are_part_of_the_brand():
+    assert normalize_merchant("Bet 365") == "bet 365"
+    assert normalize_merchant("Forever 21") == "forever 21"
+    assert normalize_merchant("Casino 777") == "casino 777"
+    assert normalize_merchant("Bet 365 #12") == "bet 365"
+
+def test_lookup_exact_and_normalized(index):
+    assert index.lookup("COINBASE.COM").category == "crypto"
+    risk = index.lookup("7-Eleven #88")
+    assert (risk.category, risk.tier) == ("convenience", RiskLevel.LOW)
+
+def test_lookup_matches_longest_token_prefix(index):
+    risk = index.lookup("Lucky Star Casino Online Ltd")
+    assert risk.matched_name == "lucky star casino"
+    assert risk.is_high_risk()
+
+def test_leading_tokens_are_not_dropped(index):
+    assert index.lookup("Co-op Food") is None
+
+def test_unknown_merchant_returns_none(index):
+    assert index.lookup("Corner Bakery") is None
+
+def test_brand_numbers_do_not_collapse_to_a_shared_prefix(tmp_path):
+    path = MerchantIndex.build([("Bet 365", "gambling", RiskLevel.HIGH)], tmp_path / "brands.bin")
+    index = MerchantIndex(path)
+    assert index.lookup("BET 365 #7").category == "gambling"
+    assert index.lookup("Bet Buddies Sports Bar") is None
+
+def test_reload_switches_to_new_file(index, tmp_path):
+    assert index.lookup("Lucky Star Casino").tier == RiskLevel.HIGH
+    new_path = MerchantIndex.build(
+        [("Lucky Star Casino", "gambling", RiskLevel.MEDIUM)], tmp_path / "merchants-v2.bin"
+    )
+    index.reload(new_path)
+    assert len(index) == 1
+    assert index.path == new_path
+    assert index.lookup("Lucky Star Casino").tier == RiskLevel.MEDIUM
+    assert index.lookup("Coinbase") is None
+
+def test_rejects_gazetteer_file(tmp_path):
+    from src.infrastructure.geo.gazetteer import Gazetteer
+    path = Gazetteer.build([("London", 51.5, -0.1)], tmp_path / "gazetteer.bin")
+    with pytest.raises(ValueError):
+        MerchantIndex(path)